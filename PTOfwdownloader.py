@@ -1,22 +1,84 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
+import collections
+import queue
 import os
 import time
 import json
-import urllib.request
+import urllib.parse
+import http.client
+import email.utils
+import socket
 import ssl
-import subprocess
-import re
+import enum
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+
+# Number of documents downloaded concurrently. The work is network-bound,
+# so threads spend almost all their time waiting on USPTO/S3.
+MAX_WORKERS = 12
+
+# Applications whose document lists may be fetched ahead of the downloads,
+# and how many applications feed documents to the pool at the same time
+APP_QUEUE_SIZE = 4
+APP_CONSUMERS = 2
+
+# Interval at which buffered log lines are written to the log window
+LOG_FLUSH_MS = 100
+
+# Read size used when streaming document bodies to disk, and the most of an
+# unwanted body (error page, redirect) read just to keep a connection reusable
+CHUNK_SIZE = 65536
+DRAIN_LIMIT = 1024 * 1024
+
+# SSL Context creation
+# A single permissive SSL context shared by every connection of every worker.
+# This helps avoid "Certificate Verify Failed" errors on some corporate networks.
+SSL_CONTEXT = ssl.create_default_context()
+SSL_CONTEXT.check_hostname = False
+SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+
+# Per-application record of verified PDFs, stored in each App_* folder
+MANIFEST_NAME = ".manifest.json"
+
+# Request constants shared by every worker
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+LIST_URL = "https://api.uspto.gov/api/v1/patent/applications/{}/documents"
+REDIRECT_STATUSES = frozenset((301, 302, 303, 307, 308))
+MAX_REDIRECTS = 5
+
+# Timeouts in seconds: the keyed first hop only has to answer with a redirect,
+# everything else may be streaming a large PDF
+PROBE_TIMEOUT = 20
+REQUEST_TIMEOUT = 120
+
+# Transient failures (rate limiting, server errors, timeouts) are retried with
+# exponential backoff, or after the server's Retry-After, capped at MAX_RETRY_DELAY
+RETRY_STATUSES = frozenset((408, 429, 500, 502, 503, 504))
+HTTP_RETRIES = 2
+RETRY_BACKOFF = 1.0
+MAX_RETRY_DELAY = 60
+
+# Translation tables for parsing the Application Numbers box in a single pass:
+# separators become spaces, then slashes are stripped from each token (12/345678 -> 12345678).
+SEPARATOR_TABLE = str.maketrans({',': ' ', '\n': ' ', '\r': ' '})
+STRIP_TABLE = str.maketrans('', '', '/,')
+
+class DocStatus(enum.Enum):
+    """Outcome of processing a single document."""
+    SKIPPED = 0   # Valid file already on disk
+    SUCCESS = 1   # Newly downloaded and verified
+    FAILED = 2    # Download or verification failed
 
 class USPTOFileWrapperDownloader(tk.Tk):
     """
     A Tkinter-based GUI application to download Patent File Wrappers in bulk from the USPTO API.
     
     This application addresses several specific challenges with the USPTO API:
-    1. TLS/SSL Handshake issues (uses system curl to bypass Python's stricter SSL context).
+    1. TLS/SSL Handshake issues (uses a permissive SSL context and reuses keep-alive connections).
     2. File Corruption (handles the redirect from USPTO to Amazon S3 correctly by stripping the API key).
     3. UI Responsiveness (runs the heavy download loop in a separate thread).
+    4. Throughput (pipelines list fetches with downloads and runs documents in parallel on a thread pool).
     """
     
     def __init__(self):
@@ -25,12 +87,8 @@ class USPTOFileWrapperDownloader(tk.Tk):
         self.geometry("900x900")
         self.configure(bg="#f5f6fa")
         
-        # SSL Context creation
-        # We create a permissive SSL context for the initial Python-based list fetching.
-        # This helps avoid "Certificate Verify Failed" errors on some corporate networks.
-        self.ssl_context = ssl.create_default_context()
-        self.ssl_context.check_hostname = False
-        self.ssl_context.verify_mode = ssl.CERT_NONE
+        # Per-thread cache of keep-alive HTTP connections, keyed by host (see _request)
+        self._local = threading.local()
 
         # --- UI Configuration ---
         style = ttk.Style(self)
@@ -58,8 +116,9 @@ class USPTOFileWrapperDownloader(tk.Tk):
         self.txt_list.pack(fill="both", expand=True, pady=(5, 20))
         
         # Progress Bar
+        # Measured in applications: finished ones plus the done fraction of those in flight (see _flush_log)
         self.progress_var = tk.DoubleVar()
-        self.progress = ttk.Progressbar(main_frame, variable=self.progress_var, maximum=100)
+        self.progress = ttk.Progressbar(main_frame, variable=self.progress_var, maximum=1)
         self.progress.pack(fill="x", pady=(0, 20))
 
         # Button Frame
@@ -88,14 +147,55 @@ class USPTOFileWrapperDownloader(tk.Tk):
         self.is_running = False
         self.stop_flag = False
 
+        # Log lines queued by any thread, written to txt_log in batches by _flush_log
+        self._log_queue = collections.deque()
+        self._log_lock = threading.Lock()
+        self.after(LOG_FLUSH_MS, self._flush_log)
+
+        # Guards the run counters shared by the application consumer threads
+        self._count_lock = threading.Lock()
+        self._processed_count = 0
+        self._success_count = 0
+        self._total_apps = 0
+        self._apps_done = 0
+        self._app_progress = {} # app_num -> [done_docs, total_docs] for applications in flight
+        self._shown_progress = (0, 0)
+
     def log(self, message):
-        """Helper to append timestamped messages to the log window safely."""
-        self.txt_log.config(state='normal') # Enable editing
-        self.txt_log.insert(tk.END, f"[{time.strftime('%H:%M:%S')}] {message}\n")
-        self.txt_log.see(tk.END) # Auto-scroll to bottom
-        self.txt_log.config(state='disabled') # Disable editing
+        """
+        Helper to append timestamped messages to the log window safely.
+        Can be called from any thread; lines are buffered and written by _flush_log.
+        """
+        with self._log_lock:
+            self._log_queue.append(f"[{time.strftime('%H:%M:%S')}] {message}\n")
         print(message) 
 
+    def _flush_log(self):
+        """
+        Writes all buffered log lines into the log window in one insert, syncs the
+        progress bar with the run counters, then re-arms itself.
+        Runs on the Tk main thread every LOG_FLUSH_MS, so the widgets redraw at most
+        that often no matter how many workers are logging or finishing documents.
+        """
+        with self._log_lock:
+            lines = list(self._log_queue)
+            self._log_queue.clear()
+        if lines:
+            self.txt_log.config(state='normal') # Enable editing
+            self.txt_log.insert(tk.END, ''.join(lines))
+            self.txt_log.see(tk.END) # Auto-scroll to bottom
+            self.txt_log.config(state='disabled') # Disable editing
+
+        # Update Progress Bar, only when the counters moved
+        with self._count_lock:
+            done = self._apps_done + sum(d / t for d, t in self._app_progress.values())
+            progress = (done, self._total_apps)
+        if progress != self._shown_progress:
+            self._shown_progress = progress
+            self.progress.config(maximum=max(progress[1], 1))
+            self.progress_var.set(progress[0])
+        self.after(LOG_FLUSH_MS, self._flush_log)
+
     def start_thread(self):
         """Starts the download process in a separate thread to prevent UI freezing."""
         if self.is_running: return
@@ -112,13 +212,16 @@ class USPTOFileWrapperDownloader(tk.Tk):
             self.btn_stop.config(state="disabled")
 
     # --- HELPERS ---
-    def verify_pdf(self, filepath):
+    def verify_pdf(self, filepath, size):
         """
-        Checks if a file exists, has content, and starts with the PDF magic bytes (%PDF).
+        Checks if a file has content and starts with the PDF magic bytes (%PDF).
         This detects if we accidentally downloaded an XML error message or HTML page.
+
+        Args:
+            filepath: Path of a file already on disk.
+            size: Its size in bytes, as taken from the application folder listing.
         """
-        if not os.path.exists(filepath): return False
-        if os.path.getsize(filepath) < 100: return False # Too small to be a valid PDF
+        if size < 100: return False # Too small to be a valid PDF
         try:
             with open(filepath, 'rb') as f:
                 header = f.read(4)
@@ -126,87 +229,389 @@ class USPTOFileWrapperDownloader(tk.Tk):
         except:
             return False
 
-    def get_redirect_url(self, url, api_key, temp_header_file):
+    def load_manifest(self, app_folder):
         """
-        Uses system 'curl' to check where a USPTO URL redirects to.
-        
-        Why this is needed:
+        Reads the {filename: size} manifest of PDFs already verified in app_folder.
+        A missing or unreadable manifest just means every existing file gets re-verified.
+        """
+        try:
+            with open(os.path.join(app_folder, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            return manifest if isinstance(manifest, dict) else {}
+        except:
+            return {}
+
+    def save_manifest(self, app_folder, manifest):
+        """Atomically rewrites the manifest of verified PDFs in app_folder."""
+        path = os.path.join(app_folder, MANIFEST_NAME)
+        try:
+            with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(manifest, f)
+            os.replace(path + '.tmp', path)
+        except Exception as e:
+            self.log(f"Manifest Write Error: {e}")
+
+    def _request(self, url, headers, timeout=REQUEST_TIMEOUT):
+        """
+        Issues a GET over this worker thread's keep-alive connection to the URL's host.
+
+        Connections are cached per thread and per host, so consecutive documents reuse
+        the same TCP/TLS session instead of paying a fresh handshake every time.
+        Timeouts and transient statuses (429, 5xx, see RETRY_STATUSES) are retried up to
+        HTTP_RETRIES times with exponential backoff, honouring Retry-After when present.
+        The caller must read the response to the end before the next request.
+        """
+        for attempt in range(HTTP_RETRIES + 1):
+            try:
+                response = self._send(url, headers, timeout)
+            except socket.timeout:
+                if attempt == HTTP_RETRIES: raise
+                delay = RETRY_BACKOFF * 2 ** attempt
+            else:
+                if response.status not in RETRY_STATUSES or attempt == HTTP_RETRIES or self.stop_flag:
+                    return response
+                delay = self._retry_delay(response, attempt)
+                self._discard(response)
+            time.sleep(delay)
+
+    def _send(self, url, headers, timeout):
+        """
+        Sends one GET on the cached connection for the URL's host and returns the response.
+        A connection the server has already closed is reopened once.
+        """
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path or '/'
+        if parts.query: path += '?' + parts.query
+        key = (parts.scheme, parts.netloc)
+        headers = dict(headers)
+        headers['User-Agent'] = USER_AGENT
+
+        conns = getattr(self._local, 'conns', None)
+        if conns is None: conns = self._local.conns = {}
+
+        for attempt in range(2):
+            conn = conns.get(key)
+            if conn is None:
+                if parts.scheme == 'https':
+                    conn = http.client.HTTPSConnection(parts.netloc, context=SSL_CONTEXT, timeout=timeout)
+                else:
+                    conn = http.client.HTTPConnection(parts.netloc, timeout=timeout)
+                conns[key] = conn
+            # A reused connection may have been opened with a different timeout
+            conn.timeout = timeout
+            if conn.sock: conn.sock.settimeout(timeout)
+            try:
+                conn.request('GET', path, headers=headers)
+                return conn.getresponse()
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                del conns[key]
+                if attempt or isinstance(e, socket.timeout): raise
+
+    def _retry_delay(self, response, attempt):
+        """Seconds to wait before retrying a transient error: Retry-After if given, else backoff."""
+        retry_after = (response.getheader('Retry-After') or '').strip()
+        if retry_after.isdigit():
+            return min(int(retry_after), MAX_RETRY_DELAY)
+        try:
+            when = email.utils.parsedate_to_datetime(retry_after)
+            return min(max(when.timestamp() - time.time(), 0), MAX_RETRY_DELAY)
+        except (TypeError, ValueError, IndexError):
+            return RETRY_BACKOFF * 2 ** attempt
+
+    def _discard(self, response):
+        """
+        Reads and throws away the rest of an unwanted response body, so the keep-alive
+        connection can be reused. A body larger than DRAIN_LIMIT is not read into memory;
+        this thread's cached connections are closed instead.
+        """
+        drained = 0
+        while drained <= DRAIN_LIMIT:
+            chunk = response.read(CHUNK_SIZE)
+            if not chunk: return
+            drained += len(chunk)
+        response.close()
+        conns = getattr(self._local, 'conns', {})
+        for conn in conns.values(): conn.close()
+        conns.clear()
+
+    def open_document(self, url, api_key):
+        """
+        Requests a USPTO document and returns the response that carries the PDF body.
+
+        Why the redirect is handled manually:
         1. USPTO files redirect to Amazon S3.
         2. If we simply follow the redirect with our API key attached, Amazon rejects it (Corruption).
-        3. We need to find the destination URL first, then download from THERE without the key.
-        
+        3. So we read the Location of the first hop ourselves and request it WITHOUT the key.
+
         Args:
             url: The initial USPTO download URL.
-            api_key: The user's key (needed for the first hop).
-            temp_header_file: Path to store the headers for inspection.
-            
+            api_key: The user's key (needed for the first hop only).
+
         Returns:
-            The redirect URL string, or None if not found.
-        """
-        if os.path.exists(temp_header_file): os.remove(temp_header_file)
-
-        # Construct curl command
-        # -s: Silent mode
-        # -D: Dump headers to file
-        # -o /dev/null: Discard the body content (we only want headers)
-        cmd = [
-            'curl', '-s', 
-            '-D', temp_header_file, 
-            '-o', '/dev/null',      
-            '-H', f'X-API-KEY: {api_key}',
-            '-H', 'User-Agent: Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            '--max-time', '20',
-            url
-        ]
-        
+            A (response, via) tuple, where via is "via S3" or "Direct".
+        Raises:
+            http.client.HTTPException if a redirect has no Location header, or if
+            there are more than MAX_REDIRECTS of them.
+        """
+        response = self._request(url, {"X-API-KEY": api_key}, PROBE_TIMEOUT)
+        if response.status not in REDIRECT_STATUSES:
+            return response, "Direct"
+
+        # S3 may redirect again; every further hop is followed WITHOUT the key too
+        for _ in range(MAX_REDIRECTS):
+            location = response.getheader('Location')
+            self._discard(response) # Drain the redirect body so the connection can be reused
+            if not location:
+                raise http.client.HTTPException(f"Redirect without Location (HTTP {response.status})")
+            url = urllib.parse.urljoin(url, location)
+            response = self._request(url, {})
+            if response.status not in REDIRECT_STATUSES:
+                return response, "via S3"
+
+        self._discard(response)
+        raise http.client.HTTPException(f"Too many redirects (more than {MAX_REDIRECTS})")
+
+    def _download_streaming(self, response, filepath):
+        """
+        Streams a PDF response body to disk, validating it on the fly.
+
+        The %PDF magic bytes are checked on the first chunk before the file is created,
+        and the size comes from the running byte count, so the file never has to be
+        re-opened or stat'ed afterwards (see verify_pdf for files already on disk).
+
+        Args:
+            response: An open 200 response returned by open_document.
+            filepath: Local path to save the file.
+
+        Returns:
+            An (ok, written) tuple. No file is left behind when ok is False.
+        """
+        chunk = response.read(CHUNK_SIZE)
+        if chunk[:4] != b'%PDF':
+            self._discard(response) # XML/HTML error body
+            return False, 0
+
+        written = 0
         try:
-            subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            if not os.path.exists(temp_header_file): return None
+            with open(filepath, 'wb') as f:
+                while chunk:
+                    f.write(chunk)
+                    written += len(chunk)
+                    chunk = response.read(CHUNK_SIZE)
+        except:
+            try: os.remove(filepath)
+            except: pass
+            raise
+
+        if written < 100: # Too small to be a valid PDF
+            os.remove(filepath)
+            return False, written
+        return True, written
+
+    def fetch_document_list(self, app_num, api_key):
+        """
+        Fetches the JSON document list of an application over the worker's keep-alive connection.
 
-            with open(temp_header_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+        Returns:
+            The documents as (doc_id, doc_code, date, url) tuples (possibly empty).
+        Raises:
+            http.client.HTTPException if the API does not answer 200.
+        """
+        list_url = LIST_URL.format(app_num)
+        response = self._request(list_url, {"X-API-KEY": api_key, "Accept": "application/json"})
+        body = response.read()
+        if response.status != 200:
+            raise http.client.HTTPException(f"HTTP Error {response.status}: {response.reason}")
+        data = json.loads(body)
+        # Handle different API response structures
+        docs = data if isinstance(data, list) else data.get('documentBag', [])
+        return self._extract_doc_tuples(docs, list_url)
+
+    def _extract_doc_tuples(self, docs, list_url):
+        """
+        Reduces the API's document dicts to compact (doc_id, doc_code, date, url) tuples
+        in one pass, so the download workers don't repeat the dict lookups.
+        """
+        doc_tuples = []
+        for doc in docs:
+            doc_id = doc.get('documentIdentifier')
+
+            # The USPTO API sometimes buries the PDF link inside 'downloadOptionBag'
+            official_url = None
+            for opt in doc.get('downloadOptionBag') or ():
+                if (opt.get('mimeTypeIdentifier') or '').upper() == 'PDF':
+                    official_url = opt.get('downloadUrl')
+                    break
+
+            # Fallback to top-level URL if bag is empty
+            if not official_url:
+                official_url = doc.get('downloadUrl', f"{list_url}/{doc_id}")
+
+            doc_tuples.append((doc_id, doc.get('documentCode', 'DOC'),
+                               doc.get('officialDate', 'nodate').split('T', 1)[0], official_url))
+        return doc_tuples
+
+    def _process_doc(self, doc, app_num, app_folder, existing, manifest, api_key):
+        """
+        Downloads a single document of an application. Runs on a pool worker thread.
 
-            # Regex search for the 'Location' header which contains the redirect URL
-            match = re.search(r'^[Ll]ocation:\s*(.+)\r?$', content, re.MULTILINE)
-            if match:
-                return match.group(1).strip()
-            
-            return None 
+        Args:
+            doc: A (doc_id, doc_code, date, url) tuple from _extract_doc_tuples.
+            existing: Dict of {filename: size} for files already in app_folder.
+            manifest: Dict of {filename: size} for files known to be valid PDFs.
+                      Updated in place with every file verified or downloaded.
 
+        Returns:
+            A DocStatus describing the outcome.
+        """
+        if self.stop_flag: return DocStatus.SKIPPED
+
+        # Metadata and D. the Download URL, already resolved by _extract_doc_tuples
+        doc_id, doc_code, date, official_url = doc
+
+        # Construct Filename: AppNum_Date_Type_ID.pdf
+        filename = f"{app_num}_{date}_{doc_code}_{doc_id}.pdf"
+        filepath = os.path.join(app_folder, filename)
+
+        # C. Check if file already exists and is valid
+        # A manifest entry with a matching size means it was verified on an earlier run.
+        if filename in existing:
+            size = existing[filename]
+            if manifest.get(filename) == size or self.verify_pdf(filepath, size):
+                # self.log(f"Skipping {filename} (Valid)") # Uncomment for verbose logging
+                manifest[filename] = size
+                return DocStatus.SKIPPED
+            else:
+                self.log(f"Replacing corrupt file: {filename}")
+                manifest.pop(filename, None)
+                try: os.remove(filepath)
+                except: pass
+
+        self.log(f"Fetching: {filename}")
+
+        # E. Download Strategy
+        # STEP 1: Request the document. A redirect to S3 is followed WITHOUT the API key.
+        # STEP 2: Stream whatever came back (S3 or direct USPTO) to disk.
+        try:
+            response, via = self.open_document(official_url, api_key)
+            if response.status != 200:
+                self._discard(response) # Drain so the connection stays usable
+                self.log(f"  > Download Failed (HTTP {response.status}): {filename}")
+                return DocStatus.FAILED
+            ok, written = self._download_streaming(response, filepath)
         except Exception as e:
-            self.log(f"  > Redirect Check Error: {e}")
-            return None
+            self.log(f"  > Download Error: {filename}: {e}")
+            return DocStatus.FAILED
+
+        if ok:
+            manifest[filename] = written
+            self.log(f"  > Success ({via}, {written // 1024} KB): {filename}")
+            return DocStatus.SUCCESS
+
+        self.log(f"  > Failed. File Corrupt: {filename}")
+        return DocStatus.FAILED
 
-    def download_final(self, url, filepath, use_key=False, api_key=None):
+    def _produce_lists(self, app_numbers, api_key, app_queue):
         """
-        Performs the actual file download using system 'curl'.
-        
-        Args:
-            url: The URL to download (either S3 or direct USPTO).
-            filepath: Local path to save the file.
-            use_key: Boolean, whether to attach the X-API-KEY header.
-                     (True for direct USPTO links, False for Amazon S3 links).
-            api_key: The key string.
-        """
-        cmd = [
-            'curl', '-L', '-s', # -L follows internal redirects, -s silent
-            '-o', filepath,
-            '-H', 'User-Agent: Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            '--max-time', '120',
-            '--retry', '2'
-        ]
-        
-        # Only add the API Key if explicitly requested (Direct downloads)
-        if use_key and api_key:
-            cmd.extend(['-H', f'X-API-KEY: {api_key}'])
+        Producer thread: fetches each application's document list in order and queues
+        (app_num, docs, error) tuples. Ends with one None sentinel per consumer.
+        """
+        for app_num in app_numbers:
+            if self.stop_flag: break
+            try:
+                app_queue.put((app_num, self.fetch_document_list(app_num, api_key), None))
+            except Exception as e:
+                app_queue.put((app_num, None, e))
+        for _ in range(APP_CONSUMERS):
+            app_queue.put(None)
+
+    def _consume_apps(self, app_queue, executor, total, root_dir, api_key):
+        """
+        Consumer thread: processes queued applications until the producer's sentinel arrives.
+        After Stop (or an unexpected error), items are still drained so the producer
+        never blocks on a full queue.
+        """
+        while True:
+            item = app_queue.get()
+            if item is None: break
+            if self.stop_flag: continue
+            try:
+                self._consume_app(item, executor, total, root_dir, api_key)
+            except Exception as e:
+                self.log(f"Application Error: {e}")
+
+    def _consume_app(self, item, executor, total, root_dir, api_key):
+        """Handles one (app_num, docs, error) item taken from the application queue."""
+        app_num, docs, error = item
+
+        with self._count_lock:
+            self._processed_count += 1
+            processed_count = self._processed_count
+
+        self.log(f"--- Processing {app_num} [{processed_count}/{total}] ---")
 
-        cmd.append(url)
-        
         try:
-            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            return result.returncode == 0
-        except Exception:
-            return False
+            # A. Document List (JSON), fetched ahead by the producer
+            if error is not None:
+                self.log(f"API List Error: {error}")
+                return
+
+            if not docs:
+                self.log(f"No documents found.")
+                return
+
+            self.log(f"Found {len(docs)} documents.")
+            saved = self._process_app(executor, app_num, docs, root_dir, api_key)
+            with self._count_lock:
+                self._success_count += saved
+        finally:
+            # Move the application from in flight to finished in one step, so the bar never dips
+            with self._count_lock:
+                self._app_progress.pop(app_num, None)
+                self._apps_done += 1
+
+    def _process_app(self, executor, app_num, docs, root_dir, api_key):
+        """
+        Downloads all documents of one application on the shared pool and waits for them.
+
+        Returns:
+            The number of newly saved valid files.
+        """
+        # Create Sub-folder for this specific application
+        app_folder = os.path.join(root_dir, f"App_{app_num}")
+        os.makedirs(app_folder, exist_ok=True)
+
+        # List the folder once instead of stat'ing every document's path
+        with os.scandir(app_folder) as entries:
+            existing = {e.name: e.stat().st_size for e in entries if e.is_file()}
+
+        # B. Download the documents of this application in parallel
+        success_count = 0
+        manifest = self.load_manifest(app_folder)
+        saved_manifest = dict(manifest)
+        with self._count_lock:
+            self._app_progress[app_num] = [0, len(docs)]
+        futures = [executor.submit(self._process_doc, doc, app_num, app_folder, existing, manifest, api_key) for doc in docs]
+        for future in as_completed(futures):
+            if self.stop_flag: break
+            with self._count_lock:
+                self._app_progress[app_num][0] += 1
+            try:
+                if future.result() == DocStatus.SUCCESS:
+                    success_count += 1
+            except Exception as e:
+                self.log(f"  > Worker Error: {e}")
+
+        # Drop queued downloads if the user pressed Stop, and let running ones finish
+        for future in futures: future.cancel()
+        wait(futures)
+
+        # Remember what was verified so the next run can skip re-reading these files
+        if manifest != saved_manifest:
+            self.save_manifest(app_folder, manifest)
+
+        return success_count
 
     def run_process(self):
         """
@@ -220,8 +625,9 @@ class USPTOFileWrapperDownloader(tk.Tk):
             messagebox.showerror("Error", "Please enter API Key.")
             return
 
-        # Clean up the list input: handle newlines, commas, slashes
-        app_numbers = [x.replace('/','').replace(',','') for x in raw_list.replace('\n',' ').replace(',',' ').split() if x.strip()]
+        # Clean up the list input: handle newlines, commas, slashes; drop duplicates, keep order
+        tokens = raw_list.translate(SEPARATOR_TABLE).split()
+        app_numbers = list(dict.fromkeys(a for a in (t.translate(STRIP_TABLE) for t in tokens) if a))
         if not app_numbers:
             messagebox.showerror("Error", "No numbers found.")
             return
@@ -230,119 +636,34 @@ class USPTOFileWrapperDownloader(tk.Tk):
         root_dir = filedialog.askdirectory()
         if not root_dir: return
         
-        # Temp file for storing header dumps during redirect checks
-        temp_header_file = os.path.join(root_dir, "temp_headers_debug.txt")
-
         # UI Updates
         self.is_running = True
         self.btn_start.config(state="disabled", text="Running...", fg="#555")
         self.btn_stop.config(state="normal", fg="black")
         self.log(f"Starting Download...")
 
-        processed_count = 0
-        success_count = 0
-
-        # Main Loop over Application Numbers
-        for app_num in app_numbers:
-            if self.stop_flag: break
-            processed_count += 1
-            
-            # Update Progress Bar
-            self.progress_var.set((processed_count / len(app_numbers)) * 100)
-            self.log(f"--- Processing {app_num} [{processed_count}/{len(app_numbers)}] ---")
-
-            # Create Sub-folder for this specific application
-            app_folder = os.path.join(root_dir, f"App_{app_num}")
-            if not os.path.exists(app_folder): os.makedirs(app_folder)
-
-            # A. Get Document List (JSON)
-            # We use Python's urllib here because it handles JSON parsing easily.
-            try:
-                list_url = f"https://api.uspto.gov/api/v1/patent/applications/{app_num}/documents"
-                req = urllib.request.Request(list_url, headers={"X-API-KEY": api_key, "Accept": "application/json"})
-                with urllib.request.urlopen(req, context=self.ssl_context) as response:
-                    data = json.loads(response.read().decode())
-                # Handle different API response structures
-                docs = data if isinstance(data, list) else data.get('documentBag', [])
-            except Exception as e:
-                self.log(f"API List Error: {e}")
-                continue
-
-            if not docs:
-                self.log(f"No documents found.")
-                continue
-
-            self.log(f"Found {len(docs)} documents.")
-
-            # B. Iterate over documents in this application
-            for doc in docs:
-                if self.stop_flag: break
-                
-                # Extract metadata
-                doc_id = doc.get('documentIdentifier')
-                doc_code = doc.get('documentCode', 'DOC')
-                date = doc.get('officialDate', 'nodate').split('T')[0]
-                
-                # Construct Filename: AppNum_Date_Type_ID.pdf
-                filename = f"{app_num}_{date}_{doc_code}_{doc_id}.pdf"
-                filepath = os.path.join(app_folder, filename)
-
-                # C. Check if file already exists and is valid
-                if os.path.exists(filepath):
-                    if self.verify_pdf(filepath):
-                        # self.log(f"Skipping {filename} (Valid)") # Uncomment for verbose logging
-                        continue
-                    else:
-                        self.log(f"Replacing corrupt file: {filename}")
-                        try: os.remove(filepath)
-                        except: pass
-
-                # D. Find the correct Download URL
-                # The USPTO API sometimes buries the PDF link inside 'downloadOptionBag'
-                official_url = None
-                options = doc.get('downloadOptionBag', [])
-                for opt in options:
-                    if opt.get('mimeTypeIdentifier', '').upper() == 'PDF':
-                        official_url = opt.get('downloadUrl')
-                        break
-                
-                # Fallback to top-level URL if bag is empty
-                if not official_url:
-                    official_url = doc.get('downloadUrl', f"{list_url}/{doc_id}")
-
-                self.log(f"Fetching: {filename}")
-
-                # E. Download Strategy
-                # STEP 1: Check for Redirect (Get S3 Link)
-                s3_url = self.get_redirect_url(official_url, api_key, temp_header_file)
-
-                if s3_url:
-                    # STEP 2a: DOWNLOAD FROM S3 (NO API KEY)
-                    # We strip the API key here so Amazon doesn't reject the request.
-                    if self.download_final(s3_url, filepath, use_key=False):
-                        if self.verify_pdf(filepath):
-                            self.log(f"  > Success (via S3).")
-                            success_count += 1
-                        else:
-                            self.log(f"  > Failed. File Corrupt.")
-                    else:
-                        self.log(f"  > Download Command Failed.")
-                else:
-                    # STEP 2b: DOWNLOAD DIRECT (WITH API KEY)
-                    # If no redirect, it's a direct file served by USPTO (requires Key).
-                    self.log(f"  > No redirect. Downloading direct...")
-                    if self.download_final(official_url, filepath, use_key=True, api_key=api_key):
-                        if self.verify_pdf(filepath):
-                             self.log(f"  > Success (Direct).")
-                             success_count += 1
-                        else:
-                             self.log(f"  > Failed. File Corrupt/Auth Missing.")
-
-                # Small delay to prevent rate limiting issues
-                time.sleep(0.1)
-
-        # Cleanup temp header file
-        if os.path.exists(temp_header_file): os.remove(temp_header_file)
+        with self._count_lock:
+            self._processed_count = 0
+            self._success_count = 0
+            self._total_apps = len(app_numbers)
+            self._apps_done = 0
+            self._app_progress.clear()
+
+        # One pool for the whole run; every application's documents are fanned out to it
+        executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+        # Pipeline: a producer thread fetches document lists ahead of time into a bounded
+        # queue, while consumer threads hand each application's documents to the pool.
+        # List requests overlap with downloads, and the next application's documents are
+        # queued while the previous one's last downloads are still running.
+        app_queue = queue.Queue(maxsize=APP_QUEUE_SIZE)
+        threads = [threading.Thread(target=self._produce_lists, args=(app_numbers, api_key, app_queue), daemon=True)]
+        threads += [threading.Thread(target=self._consume_apps, args=(app_queue, executor, len(app_numbers), root_dir, api_key), daemon=True)
+                    for _ in range(APP_CONSUMERS)]
+        for t in threads: t.start()
+        for t in threads: t.join()
+        executor.shutdown(wait=True)
+        success_count = self._success_count
 
         # Reset UI state
         self.is_running = False